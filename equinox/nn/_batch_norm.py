@@ -1,3 +1,4 @@
+import functools as ft
 from collections.abc import Hashable, Sequence
 from typing import Optional, Union
 
@@ -12,6 +13,41 @@ from ._sequential import StatefulLayer
 from ._stateful import State, StateIndex
 
 
+def _abs_squared(x: Array) -> Array:
+    # Avoids the complex multiply of `x * jnp.conj(x)`, and returns a real array.
+    if jnp.iscomplexobj(x):
+        return x.real**2 + x.imag**2
+    else:
+        return x * x
+
+
+def _is_half_precision(x: Array) -> bool:
+    return jnp.issubdtype(x.dtype, jnp.floating) and jnp.finfo(x.dtype).bits < 32
+
+
+@ft.lru_cache(maxsize=None)
+def _broadcast_shape(ndim: int) -> tuple[int, ...]:
+    # Shape to reshape `(input_size,)` statistics to, to broadcast against the input.
+    return (-1,) + (1,) * (ndim - 1)
+
+
+def _norm(
+    x: Array,
+    mean: Array,
+    var: Array,
+    weight: Optional[Array],
+    bias: Optional[Array],
+    eps: float,
+) -> Array:
+    # Broadcast the `(input_size,)` statistics against `x`, rather than `vmap`ing
+    # over channels, so that normalisation is a single elementwise operation.
+    shape = _broadcast_shape(x.ndim)
+    out = (x - mean.reshape(shape)) * lax.rsqrt(var.reshape(shape) + eps)
+    if weight is not None and bias is not None:
+        out = out * weight.reshape(shape) + bias.reshape(shape)
+    return out
+
+
 class BatchNorm(StatefulLayer, strict=True):
     r"""Computes a mean and standard deviation over the batch and spatial
     dimensions of an array, and uses these to normalise the whole array. Optionally
@@ -84,7 +120,8 @@ class BatchNorm(StatefulLayer, strict=True):
         - `dtype`: The dtype to use for the running statistics and the weight and bias
             if `channelwise_affine` is `True`. Defaults to either
             `jax.numpy.float32` or `jax.numpy.float64` depending on whether JAX is in
-            64-bit mode.
+            64-bit mode. (Batch statistics of half-precision inputs are always
+            computed in single precision, before being cast to this dtype.)
         """
         dtype = default_floating_dtype() if dtype is None else dtype
         if channelwise_affine:
@@ -95,8 +132,8 @@ class BatchNorm(StatefulLayer, strict=True):
             self.bias = None
         self.first_time_index = StateIndex(jnp.array(True))
         init_buffers = (
-            jnp.empty((input_size,), dtype=dtype),
-            jnp.empty((input_size,), dtype=dtype),
+            jnp.zeros((input_size,), dtype=dtype),
+            jnp.zeros((input_size,), dtype=dtype),
         )
         self.state_index = StateIndex(init_buffers)
         self.inference = inference
@@ -144,32 +181,54 @@ class BatchNorm(StatefulLayer, strict=True):
         if inference:
             running_mean, running_var = state.get(self.state_index)
         else:
-
-            def _stats(y):
-                mean = jnp.mean(y)
-                mean = lax.pmean(mean, self.axis_name)
-                var = jnp.mean((y - mean) * jnp.conj(y - mean))
-                var = lax.pmean(var, self.axis_name)
-                var = jnp.maximum(0.0, var)
-                return mean, var
-
             first_time = state.get(self.first_time_index)
             state = state.set(self.first_time_index, jnp.array(False))
 
-            batch_mean, batch_var = jax.vmap(_stats)(x)
+            # Accumulate the statistics in at least single precision: reduced
+            # precision loses too much accuracy in the mean and variance.
+            if _is_half_precision(x):
+                x_stats = x.astype(jnp.float32)
+            elif jnp.issubdtype(x.dtype, jnp.inexact):
+                x_stats = x
+            else:
+                x_stats = x.astype(default_floating_dtype())
+
+            # Reduce over every non-channel axis at once, so that each statistic needs
+            # only a single `pmean` (i.e. a single collective) for all channels. The
+            # variance is computed about the mean, rather than as
+            # E[|x|^2] - |E[x]|^2, as the latter suffers catastrophic cancellation
+            # when the mean is large relative to the spread.
+            axes = tuple(range(1, x.ndim))
+            batch_mean = lax.pmean(jnp.mean(x_stats, axis=axes), self.axis_name)
+            centred = x_stats - batch_mean.reshape(_broadcast_shape(x.ndim))
+            batch_var = jnp.mean(_abs_squared(centred), axis=axes)
+            batch_var = lax.pmean(batch_var.astype(batch_mean.dtype), self.axis_name)
             running_mean, running_var = state.get(self.state_index)
-            momentum = self.momentum
+            if jnp.iscomplexobj(x) and not jnp.iscomplexobj(running_mean):
+                raise ValueError(
+                    "`BatchNorm` received a complex input, but its running statistics "
+                    "are real. Pass a complex `dtype` to `BatchNorm.__init__`."
+                )
+            if _is_half_precision(x):
+                batch_mean = batch_mean.astype(running_mean.dtype)
+                batch_var = batch_var.astype(running_var.dtype)
+            # On the first step use a momentum of zero, to overwrite the initial
+            # running statistics with the batch statistics. Doing this arithmetically
+            # fuses into the update, rather than needing a select. (This relies on
+            # the running statistics being initialised to finite values.)
+            momentum = self.momentum * (1 - first_time.astype(running_mean.dtype))
             running_mean = (1 - momentum) * batch_mean + momentum * running_mean
             running_var = (1 - momentum) * batch_var + momentum * running_var
-            running_mean = lax.select(first_time, batch_mean, running_mean)
-            running_var = lax.select(first_time, batch_var, running_var)
             state = state.set(self.state_index, (running_mean, running_var))
 
-        def _norm(y, m, v, w, b):
-            out = (y - m) / jnp.sqrt(v + self.eps)
-            if self.channelwise_affine:
-                out = out * w + b
-            return out
-
-        out = jax.vmap(_norm)(x, running_mean, running_var, self.weight, self.bias)
+        weight = self.weight
+        bias = self.bias
+        if _is_half_precision(x):
+            # Keep the elementwise work in the (cheaper) precision of the input.
+            running_mean = running_mean.astype(x.dtype)
+            running_var = running_var.astype(x.dtype)
+            if weight is not None and bias is not None:
+                weight = weight.astype(x.dtype)
+                bias = bias.astype(x.dtype)
+        out = _norm(x, running_mean, running_var, weight, bias, self.eps)
         return out, state
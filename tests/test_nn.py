@@ -981,6 +981,82 @@ def test_batch_norm(getkey):
     )
     assert jnp.allclose(out, true_out)
 
+    # Test that the first step overwrites the running statistics
+
+    running_mean, running_var = state.get(bn.state_index)
+    assert jnp.allclose(running_mean, jnp.mean(x1alt, axis=0))
+    assert jnp.allclose(running_var, jnp.var(x1alt, axis=0))
+
+    # Test that it normalises over the spatial dimensions too
+
+    x3alt = jrandom.normal(jrandom.PRNGKey(5678), (10, 5, 7, 8))
+    bn3 = eqx.nn.BatchNorm(5, "batch", channelwise_affine=False)
+    state3 = eqx.nn.State(bn3)
+    vbn3 = jax.vmap(bn3, axis_name="batch", in_axes=(0, None), out_axes=(0, None))
+    out, state3 = vbn3(x3alt, state3)
+    true_out = (x3alt - jnp.mean(x3alt, axis=(0, 2, 3), keepdims=True)) / jnp.sqrt(
+        jnp.var(x3alt, axis=(0, 2, 3), keepdims=True) + 1e-5
+    )
+    assert jnp.allclose(out, true_out, atol=1e-5)
+
+    # Test that it normalises complex inputs
+
+    xc = jax.lax.complex(x3alt, jrandom.normal(jrandom.PRNGKey(1234), x3alt.shape))
+    bnc = eqx.nn.BatchNorm(5, "batch", channelwise_affine=False, dtype=jnp.complex64)
+    statec = eqx.nn.State(bnc)
+    vbnc = jax.vmap(bnc, axis_name="batch", in_axes=(0, None), out_axes=(0, None))
+    out, statec = vbnc(xc, statec)
+    xc_centred = xc - jnp.mean(xc, axis=(0, 2, 3), keepdims=True)
+    xc_var = jnp.mean(xc_centred * jnp.conj(xc_centred), axis=(0, 2, 3), keepdims=True)
+    assert jnp.allclose(out, xc_centred / jnp.sqrt(xc_var + 1e-5), atol=1e-5)
+
+    bnc = eqx.nn.BatchNorm(5, "batch", channelwise_affine=False)
+    statec = eqx.nn.State(bnc)
+    vbnc = jax.vmap(bnc, axis_name="batch", in_axes=(0, None), out_axes=(0, None))
+    with pytest.raises(ValueError, match="complex"):
+        vbnc(xc, statec)
+
+    # Test that the variance is accurate for inputs with a large mean relative to
+    # their spread
+
+    xo = 1000 + 0.1 * jrandom.normal(jrandom.PRNGKey(4321), (64, 3, 8, 8))
+    bno = eqx.nn.BatchNorm(3, "batch", channelwise_affine=False)
+    stateo = eqx.nn.State(bno)
+    vbno = jax.vmap(bno, axis_name="batch", in_axes=(0, None), out_axes=(0, None))
+    out, stateo = vbno(xo, stateo)
+    _, running_var = stateo.get(bno.state_index)
+    assert jnp.allclose(running_var, jnp.var(xo, axis=(0, 2, 3)), rtol=1e-2)
+    assert jnp.allclose(jnp.std(out, axis=(0, 2, 3)), 1, rtol=1e-2)
+    # ...including on later steps, as the inputs drift. (Recover the batch variance
+    # from the running average, as it only contributes `1 - momentum` to it.)
+    out, stateo = vbno(xo + 1, stateo)
+    _, running_var2 = stateo.get(bno.state_index)
+    batch_var = (running_var2 - 0.99 * running_var) / 0.01
+    assert jnp.allclose(batch_var, jnp.var(xo + 1, axis=(0, 2, 3)), rtol=1e-2)
+
+    # Test that half-precision statistics are accumulated in single precision
+
+    xh = (3 * x3alt + 100).astype(jnp.bfloat16)
+    bnh = eqx.nn.BatchNorm(5, "batch", channelwise_affine=False)
+    stateh = eqx.nn.State(bnh)
+    vbnh = jax.vmap(bnh, axis_name="batch", in_axes=(0, None), out_axes=(0, None))
+    out, stateh = vbnh(xh, stateh)
+    assert out.dtype == jnp.bfloat16
+    running_mean, running_var = stateh.get(bnh.state_index)
+    assert running_mean.dtype == jnp.float32
+    assert running_var.dtype == jnp.float32
+    xh32 = xh.astype(jnp.float32)
+    assert jnp.allclose(running_mean, jnp.mean(xh32, axis=(0, 2, 3)))
+    assert jnp.allclose(running_var, jnp.var(xh32, axis=(0, 2, 3)), rtol=1e-3)
+
+    bnh = eqx.nn.BatchNorm(5, "batch")
+    stateh = eqx.nn.State(bnh)
+    vbnh = jax.vmap(bnh, axis_name="batch", in_axes=(0, None), out_axes=(0, None))
+    out, stateh = vbnh(xh, stateh)
+    assert out.dtype == jnp.bfloat16
+    running_mean, _ = stateh.get(bnh.state_index)
+    assert running_mean.dtype == jnp.float32
+
     # Test that the statistics update during training
     out, state = vbn(x1, state)
     running_mean, running_var = state.get(bn.state_index)